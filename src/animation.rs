@@ -19,10 +19,12 @@ impl AnimationInfo {
     pub fn position(&self, i: usize) -> Vec2 {
         Vec2::from(self.positions[i].map(|x| x as f32))
     }
-    #[allow(clippy::len_without_is_empty)]
     pub fn len(&self) -> usize {
         self.positions.len()
     }
+    pub fn is_empty(&self) -> bool {
+        self.positions.is_empty()
+    }
 }
 
 pub struct Animation<'a> {
@@ -33,8 +35,9 @@ pub struct Animation<'a> {
 }
 
 impl<'a> Animation<'a> {
+    /// Animation `info` must be non-empty, this should be checked on loading.
     pub fn new(texture: &'a Texture2D, info: &'a AnimationInfo, period: Duration) -> Self {
-        assert_ne!(info.len(), 0);
+        debug_assert!(!info.is_empty());
         Self {
             texture,
             info,
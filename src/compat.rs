@@ -1,6 +1,7 @@
 use macroquad::{
     camera::{set_camera, set_default_camera, Camera2D},
-    input::mouse_wheel,
+    input::{is_key_down, mouse_wheel, KeyCode},
+    math::Vec2,
 };
 
 pub fn reset_camera() {
@@ -14,3 +15,20 @@ pub fn mouse_wheel_clamped() -> (f32, f32) {
     let (x, y) = mouse_wheel();
     (x.clamp(-1.0, 1.0), y.clamp(-1.0, 1.0))
 }
+
+/// Arrow and WASD keys with their motion directions
+const MOTION_KEYS: [([KeyCode; 2], Vec2); 4] = [
+    ([KeyCode::Up, KeyCode::W], Vec2::NEG_Y),
+    ([KeyCode::Down, KeyCode::S], Vec2::Y),
+    ([KeyCode::Left, KeyCode::A], Vec2::NEG_X),
+    ([KeyCode::Right, KeyCode::D], Vec2::X),
+];
+
+/// Motion direction from pressed arrow and WASD keys (not normalized).
+pub fn motion_keys() -> Vec2 {
+    MOTION_KEYS
+        .iter()
+        .filter(|(keys, _)| keys.iter().any(|&key| is_key_down(key)))
+        .map(|&(_, dir)| dir)
+        .sum()
+}
@@ -3,7 +3,7 @@ use anyhow::Error;
 use glam::Vec2;
 use macroquad::{
     color,
-    input::{is_key_down, is_key_pressed, KeyCode},
+    input::{get_last_key_pressed, is_key_down, is_key_pressed, KeyCode},
     math::Rect,
     miniquad::window::screen_size,
     texture::{
@@ -34,23 +34,36 @@ struct Item {
 
 const INPUT_TIMEOUT: Duration = Duration::from_secs(4);
 
-pub async fn main() -> Result<(), Error> {
-    set_default_filter_mode(FilterMode::Nearest);
+/// Keys for digits `0..=9`, indexed by digit
+const NUM_KEYS: [[KeyCode; 2]; 10] = [
+    [KeyCode::Key0, KeyCode::Kp0],
+    [KeyCode::Key1, KeyCode::Kp1],
+    [KeyCode::Key2, KeyCode::Kp2],
+    [KeyCode::Key3, KeyCode::Kp3],
+    [KeyCode::Key4, KeyCode::Kp4],
+    [KeyCode::Key5, KeyCode::Kp5],
+    [KeyCode::Key6, KeyCode::Kp6],
+    [KeyCode::Key7, KeyCode::Kp7],
+    [KeyCode::Key8, KeyCode::Kp8],
+    [KeyCode::Key9, KeyCode::Kp9],
+];
+
+pub async fn main([apple, pear, orange]: [Texture2D; 3]) -> Result<(), Error> {
     let items = [
         Item {
-            image: load_texture("apple.png").await?,
+            image: apple,
             stem: "яблок",
             endings: ["о", "а", ""],
             gender: Gender::Neuter,
         },
         Item {
-            image: load_texture("pear.png").await?,
+            image: pear,
             stem: "груш",
             endings: ["а", "и", ""],
             gender: Gender::Feminine,
         },
         Item {
-            image: load_texture("orange.png").await?,
+            image: orange,
             stem: "апельсин",
             endings: ["", "а", "ов"],
             gender: Gender::Masculine,
@@ -86,6 +99,12 @@ pub async fn main() -> Result<(), Error> {
     let mut number: i64 = rng.sample(Uniform::new_inclusive(1, max_number));
     let mut item = &items[0];
 
+    // Texts are rebuilt only when shown number or item changes
+    let mut shown_number = number;
+    let mut shown_stem = item.stem;
+    let mut number_text = number.to_string();
+    let mut caption_text = items_text(number, item.stem, item.endings, item.gender);
+
     let mut input = Vec::<i64>::new();
     let mut input_cooldown = Duration::ZERO;
 
@@ -106,24 +125,15 @@ pub async fn main() -> Result<(), Error> {
                 };
             }
 
-            const NUM_KEYS: [[KeyCode; 2]; 10] = [
-                [KeyCode::Key0, KeyCode::Kp0],
-                [KeyCode::Key1, KeyCode::Kp1],
-                [KeyCode::Key2, KeyCode::Kp2],
-                [KeyCode::Key3, KeyCode::Kp3],
-                [KeyCode::Key4, KeyCode::Kp4],
-                [KeyCode::Key5, KeyCode::Kp5],
-                [KeyCode::Key6, KeyCode::Kp6],
-                [KeyCode::Key7, KeyCode::Kp7],
-                [KeyCode::Key8, KeyCode::Kp8],
-                [KeyCode::Key9, KeyCode::Kp9],
-            ];
-            let mut key_num = None;
-            for (i, [k, kp]) in NUM_KEYS.iter().copied().enumerate() {
-                if is_key_pressed(k) || is_key_pressed(kp) {
-                    key_num = Some(i as i64);
-                }
-            }
+            // Skip scanning digit keys on frames without any key press
+            let key_num = if get_last_key_pressed().is_some() {
+                NUM_KEYS
+                    .iter()
+                    .rposition(|&[k, kp]| is_key_pressed(k) || is_key_pressed(kp))
+                    .map(|i| i as i64)
+            } else {
+                None
+            };
 
             let mut apply = false;
 
@@ -218,8 +228,16 @@ pub async fn main() -> Result<(), Error> {
                 color::DARKGRAY,
             );
         }
+        if shown_number != number || shown_stem != item.stem {
+            if shown_number != number {
+                number_text = number.to_string();
+            }
+            caption_text = items_text(number, item.stem, item.endings, item.gender);
+            shown_number = number;
+            shown_stem = item.stem;
+        }
         draw_text_aligned(
-            &format!("{number}"),
+            &number_text,
             text_pos.x,
             text_pos.y,
             TextAlign::Center,
@@ -228,7 +246,7 @@ pub async fn main() -> Result<(), Error> {
             color::WHITE,
         );
         draw_text_aligned(
-            &items_text(number, item.stem, item.endings, item.gender),
+            &caption_text,
             text_pos.x,
             text_pos.y + 1.0 * scale,
             TextAlign::Center,
@@ -278,19 +296,18 @@ fn draw_items(number: i64, pos: Vec2, scale: f32, texture: &Texture2D, gap: bool
         let n = number.min(10);
         padding * (n + if gap { 2 * (n / 5) } else { 0 }) as f32 + n as f32
     };
+    let x0 = pos.x - scale * width / 2.0;
+    let dest_size = Some(Vec2::splat(scale));
     for j in 0..=(number / 10) {
+        let y = pos.y + scale * (-0.5 + (1.0 + padding) * j as f32);
         for i in 0..(number - j * 10).min(10) {
             draw_texture_ex(
                 texture,
-                pos.x
-                    + scale
-                        * (-width / 2.0
-                            + padding * if gap { i + 2 * (i / 5) } else { 0 } as f32
-                            + i as f32),
-                pos.y + scale * (-0.5 + (1.0 + padding) * j as f32),
+                x0 + scale * (padding * if gap { i + 2 * (i / 5) } else { 0 } as f32 + i as f32),
+                y,
                 color::WHITE,
                 DrawTextureParams {
-                    dest_size: Some(Vec2::new(scale, scale)),
+                    dest_size,
                     ..Default::default()
                 },
             );
@@ -392,6 +409,8 @@ fn items_text(mut n: i64, stem: &str, endings: [&str; 3], gender: Gender) -> Str
 
 pub struct Game {
     apple: Texture2D,
+    pear: Texture2D,
+    orange: Texture2D,
 }
 
 impl Game {
@@ -399,6 +418,8 @@ impl Game {
         set_default_filter_mode(FilterMode::Nearest);
         Ok(Self {
             apple: load_texture("apple.png").await?,
+            pear: load_texture("pear.png").await?,
+            orange: load_texture("orange.png").await?,
         })
     }
 }
@@ -422,6 +443,10 @@ impl crate::Game for Game {
     }
 
     fn launch(&self) -> Pin<Box<dyn Future<Output = Result<(), Error>>>> {
-        Box::pin(main())
+        Box::pin(main([
+            self.apple.clone(),
+            self.pear.clone(),
+            self.orange.clone(),
+        ]))
     }
 }
@@ -49,8 +49,10 @@ pub fn intersect_circle_and_plane(
 /// Returns area and barycenter of intersection.
 pub fn intersect_circles(ac: Vec2, ar: f32, bc: Vec2, br: f32) -> Option<(f32, Vec2)> {
     let vec = bc - ac;
-    let dist = vec.length();
-    if dist < ar + br {
+    // Reject distant circles before taking square root
+    let dist_sqr = vec.length_squared();
+    if dist_sqr < (ar + br).powi(2) {
+        let dist = dist_sqr.sqrt();
         if dist > (ar - br).abs() {
             let dir = vec / dist;
             let ax = 0.5 * (dist + (ar.powi(2) - br.powi(2)) / dist);
@@ -68,10 +70,35 @@ pub fn intersect_circles(ac: Vec2, ar: f32, bc: Vec2, br: f32) -> Option<(f32, V
     }
 }
 
+/// Broad phase for circles given as `(center, radius)`.
+///
+/// Returns pairs of indices `(i, j)` with `i < j` of circles whose projections on X axis overlap.
+/// Circles are sorted by left bound and only neighbours within the right bound are checked.
+pub fn overlapping_pairs(circles: impl IntoIterator<Item = (Vec2, f32)>) -> Vec<(usize, usize)> {
+    let bounds: Vec<(f32, f32)> = circles
+        .into_iter()
+        .map(|(center, radius)| (center.x - radius, center.x + radius))
+        .collect();
+    let mut order: Vec<usize> = (0..bounds.len()).collect();
+    order.sort_unstable_by(|&i, &j| f32::total_cmp(&bounds[i].0, &bounds[j].0));
+
+    let mut pairs = Vec::new();
+    for (k, &i) in order.iter().enumerate() {
+        for &j in &order[(k + 1)..] {
+            if bounds[j].0 >= bounds[i].1 {
+                break;
+            }
+            pairs.push((i.min(j), i.max(j)));
+        }
+    }
+    pairs
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
     use approx::assert_abs_diff_eq;
+    use rand::{distributions::Uniform, rngs::SmallRng, Rng, SeedableRng};
 
     const R: f32 = 1.234;
 
@@ -90,6 +117,96 @@ mod tests {
         assert_eq!(circle_segment(R, 0.0).0, PI * R.powi(2) / 2.0);
     }
 
+    #[test]
+    fn separate_circles() {
+        assert_eq!(
+            intersect_circles(Vec2::ZERO, R, Vec2::new(2.0 * R + EPS, 0.0), R),
+            None
+        );
+    }
+
+    #[test]
+    fn nested_circles() {
+        assert_eq!(
+            intersect_circles(Vec2::ZERO, R, Vec2::new(0.1 * R, 0.0), 0.5 * R),
+            Some((PI * (0.5 * R).powi(2), Vec2::new(0.1 * R, 0.0)))
+        );
+    }
+
+    fn assert_pairs_match_brute_force(circles: &[(Vec2, f32)]) {
+        let mut pairs = overlapping_pairs(circles.iter().copied());
+        pairs.sort();
+
+        let mut bf_pairs = Vec::new();
+        let mut bf_intersections = Vec::new();
+        for (i, &(ac, ar)) in circles.iter().enumerate() {
+            for (j, &(bc, br)) in circles.iter().enumerate().skip(i + 1) {
+                if ac.x - ar < bc.x + br && bc.x - br < ac.x + ar {
+                    bf_pairs.push((i, j));
+                }
+                if intersect_circles(ac, ar, bc, br).is_some() {
+                    bf_intersections.push((i, j));
+                }
+            }
+        }
+        assert_eq!(pairs, bf_pairs);
+
+        let intersections: Vec<_> = pairs
+            .into_iter()
+            .filter(|&(i, j)| {
+                let ((ac, ar), (bc, br)) = (circles[i], circles[j]);
+                intersect_circles(ac, ar, bc, br).is_some()
+            })
+            .collect();
+        assert_eq!(intersections, bf_intersections);
+    }
+
+    #[test]
+    fn overlapping_touching_circles() {
+        let circles = [(Vec2::ZERO, R), (Vec2::new(2.0 * R, 0.0), R)];
+        assert_pairs_match_brute_force(&circles);
+        assert!(overlapping_pairs(circles).is_empty());
+    }
+
+    #[test]
+    fn overlapping_nested_circles() {
+        let circles = [
+            (Vec2::new(0.1 * R, 0.0), 0.5 * R),
+            (Vec2::ZERO, R),
+            (Vec2::new(0.0, 0.2 * R), 0.2 * R),
+        ];
+        assert_pairs_match_brute_force(&circles);
+        assert_eq!(overlapping_pairs(circles).len(), 3);
+    }
+
+    #[test]
+    fn overlapping_unsorted_circles() {
+        let circles = [
+            (Vec2::new(3.0 * R, 0.0), R),
+            (Vec2::new(-3.0 * R, 0.0), R),
+            (Vec2::new(1.5 * R, 0.5 * R), R),
+            (Vec2::new(-1.5 * R, -0.5 * R), R),
+            (Vec2::new(0.0, 4.0 * R), R),
+        ];
+        assert_pairs_match_brute_force(&circles);
+    }
+
+    #[test]
+    fn overlapping_random_circles() {
+        let mut rng = SmallRng::seed_from_u64(0xdeadbeef);
+        let coord = Uniform::new(-4.0, 4.0);
+        let radius = Uniform::new(0.1, 1.0);
+        let circles: Vec<_> = (0..64)
+            .map(|_| {
+                (
+                    Vec2::new(rng.sample(&coord), rng.sample(&coord)),
+                    rng.sample(&radius),
+                )
+            })
+            .collect();
+        assert_pairs_match_brute_force(&circles);
+    }
+
     #[test]
     fn numerical_segment() {
         let f = |x: f64| 2.0 * (1.0 - (1.0 - x).powi(2)).sqrt();
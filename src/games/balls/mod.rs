@@ -125,7 +125,7 @@ impl World {
     fn drag_acquire(&mut self, pos: Vec2) {
         self.drag = self.items.iter().enumerate().find_map(|(i, item)| {
             let rel_pos = pos - *item.pos;
-            if rel_pos.length() < item.shape.radius() {
+            if rel_pos.length_squared() < item.shape.radius().powi(2) {
                 let rpos = item.rot.inverse().transform(rel_pos);
                 Some((i, pos, rpos))
             } else {
@@ -239,13 +239,13 @@ struct TextureStorage {
     noise: Texture2D,
 }
 
-pub async fn main() -> Result<(), Error> {
+pub async fn main(ball: Texture2D) -> Result<(), Error> {
     let mut rng = SmallRng::seed_from_u64(0xdeadbeef);
 
     let font = load_default_font().await?;
 
     let textures = TextureStorage {
-        ball: load_texture("ball.png").await?,
+        ball,
         noise: { noisy_texture(&mut rng, 32, 32, Vec3::splat(0.75), Vec3::splat(0.25)) },
     };
 
@@ -260,14 +260,18 @@ pub async fn main() -> Result<(), Error> {
 
     let mut mode = DrawMode::Normal;
 
-    while !is_key_down(KeyCode::Escape) {
-        viewport = Vec2::from(screen_size());
-        toy_box.resize(viewport / scale);
+    let mut camera = Camera2D {
+        zoom: viewport.recip() * scale,
+        ..Default::default()
+    };
 
-        let camera = Camera2D {
-            zoom: viewport.recip() * scale,
-            ..Default::default()
-        };
+    while !is_key_down(KeyCode::Escape) {
+        // Update world size and camera only when window is resized
+        if viewport != Vec2::from(screen_size()) {
+            viewport = Vec2::from(screen_size());
+            toy_box.resize(viewport / scale);
+            camera.zoom = viewport.recip() * scale;
+        }
 
         {
             if is_key_pressed(KeyCode::Equal) || is_key_pressed(KeyCode::KpAdd) {
@@ -388,6 +392,6 @@ impl crate::Game for Game {
     }
 
     fn launch(&self) -> Pin<Box<dyn Future<Output = Result<(), Error>>>> {
-        Box::pin(main())
+        Box::pin(main(self.ball.clone()))
     }
 }
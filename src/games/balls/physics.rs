@@ -1,5 +1,5 @@
 use super::{
-    geometry::{intersect_circle_and_plane, intersect_circles},
+    geometry::{intersect_circle_and_plane, intersect_circles, overlapping_pairs},
     Item, World,
 };
 use crate::{
@@ -155,21 +155,24 @@ impl World {
             contact_wall(actor, item, -wall_size.y, Vec2::new(0.0, -1.0));
         }
 
-        for i in 1..self.items.len() {
-            let (left, other_items) = self.items.split_at_mut(i);
-            let this = left.last_mut().unwrap();
-            for other in other_items {
-                if let Some((area, barycenter)) = intersect_circles(
-                    *this.pos,
-                    this.shape.radius(),
-                    *other.pos,
-                    other.shape.radius(),
-                ) {
-                    let dir = (*other.pos - *this.pos).normalize_or_zero();
-                    let def = area.sqrt();
-                    this.contact(actor, -def * dir, barycenter, other.vel_at(barycenter));
-                    other.contact(actor, def * dir, barycenter, this.vel_at(barycenter));
-                }
+        let pairs = overlapping_pairs(
+            self.items
+                .iter()
+                .map(|item| (*item.pos, item.shape.radius())),
+        );
+        for (i, j) in pairs {
+            let (left, right) = self.items.split_at_mut(j);
+            let (this, other) = (&mut left[i], &mut right[0]);
+            if let Some((area, barycenter)) = intersect_circles(
+                *this.pos,
+                this.shape.radius(),
+                *other.pos,
+                other.shape.radius(),
+            ) {
+                let dir = (*other.pos - *this.pos).normalize_or_zero();
+                let def = area.sqrt();
+                this.contact(actor, -def * dir, barycenter, other.vel_at(barycenter));
+                other.contact(actor, def * dir, barycenter, this.vel_at(barycenter));
             }
         }
 
@@ -42,7 +42,7 @@ impl System for (&Terrain, &mut Vehicle) {
     }
 }
 
-pub async fn main() -> Result<(), Error> {
+pub async fn main(model: VehicleModel) -> Result<(), Error> {
     let mut rng = SmallRng::seed_from_u64(0xdeadbeef);
     set_default_filter_mode(FilterMode::Linear);
 
@@ -58,12 +58,6 @@ pub async fn main() -> Result<(), Error> {
             Vec3::new(0.25, 0.25, 0.25),
         ),
     );
-    let model = VehicleModel::new(
-        serde_json::from_slice(&load_file("l200.json").await?)?,
-        load_model("l200.obj").await?,
-        load_texture("l200.png").await?,
-    );
-
     fn grab(state: bool) {
         show_mouse(!state);
         set_cursor_grab(state);
@@ -213,6 +207,6 @@ impl crate::Game for Game {
     }
 
     fn launch(&self) -> Pin<Box<dyn Future<Output = Result<(), Error>>>> {
-        Box::pin(main())
+        Box::pin(main(self.vehicle.clone()))
     }
 }
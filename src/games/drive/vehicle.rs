@@ -111,6 +111,7 @@ pub fn make_wheel_model(
     }
 }
 
+#[derive(Clone)]
 pub struct VehicleModel {
     config: VehicleConfig,
 
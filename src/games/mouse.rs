@@ -1,8 +1,10 @@
-use crate::text::{draw_text_aligned, load_default_font, TextAlign};
+use crate::{
+    compat::motion_keys,
+    text::{draw_text_aligned, load_default_font, TextAlign},
+};
 use anyhow::Error;
 use core::f32;
 use derive_more::derive::{Deref, DerefMut};
-use futures::{future::try_join_all, TryFutureExt};
 use glam::Vec2;
 use macroquad::{
     camera::{set_camera, set_default_camera, Camera2D},
@@ -26,77 +28,81 @@ use rand::{
 use rand_distr::Poisson;
 use std::{f32::consts::PI, future::Future, pin::Pin, time::Duration};
 
-#[derive(Clone, Debug)]
-pub struct Item {
+#[derive(Clone, Copy, Debug)]
+pub struct Item<'a> {
     pub pos: Vec2,
-    pub image: Texture2D,
+    pub image: &'a Texture2D,
     pub radius: f32,
 }
 
-impl Item {
+impl<'a> Item<'a> {
     pub fn draw(&self, offset: Vec2) {
         draw_texture_ex(
-            &self.image,
+            self.image,
             self.pos.x + offset.x - self.radius,
             self.pos.y + offset.y - self.radius,
             color::WHITE,
             DrawTextureParams {
-                dest_size: Some(2.0 * Vec2::new(self.radius, self.radius)),
+                dest_size: Some(Vec2::splat(2.0 * self.radius)),
                 ..Default::default()
             },
         );
     }
 }
 
-#[derive(Clone, Debug, Deref, DerefMut)]
-pub struct Player {
+#[derive(Clone, Copy, Debug, Deref, DerefMut)]
+pub struct Player<'a> {
     #[deref]
     #[deref_mut]
-    pub base: Item,
+    pub base: Item<'a>,
     pub speed: f32,
 }
 
-pub async fn main() -> Result<(), Error> {
-    set_default_filter_mode(FilterMode::Nearest);
-    let player_image = load_texture("mouse.png").await?;
-    let items_images_and_probs = try_join_all(
-        vec![("cheese.png", 0.8), ("apple.png", 0.2)]
-            .into_iter()
-            .map(|(path, prob)| load_texture(path).map_ok(move |t| (t, prob))),
-    )
-    .await?;
+/// Items are spawned with `items_images_and_probs` textures with given probabilities.
+pub async fn main(
+    player_image: Texture2D,
+    items_images_and_probs: Vec<(Texture2D, f32)>,
+) -> Result<(), Error> {
     let font = load_default_font().await?;
 
     let mut rng = SmallRng::seed_from_u64(0xdeadbeef);
 
+    // Session parameters and distributions don't change between sessions
+    let map_size = Vec2::from([40.0, 30.0]);
+    let mean_items: f32 = 16.0;
+    let num_items_distr = Poisson::new(mean_items).unwrap();
+    let item_radius = 0.5;
+    let x_distr = Uniform::new(item_radius, map_size.x - item_radius);
+    let y_distr = Uniform::new(item_radius, map_size.y - item_radius);
+    let image_distr =
+        WeightedIndex::new(items_images_and_probs.iter().map(|(_, prob)| prob)).unwrap();
+
     loop {
-        let map_size = Vec2::from([40.0, 30.0]);
-        let mean_items: f32 = 16.0;
-        let num_items = rng.sample(Poisson::new(mean_items).unwrap()).round() as usize;
+        let num_items = rng.sample(&num_items_distr).round() as usize;
 
         let mut player = Player {
             base: Item {
                 pos: map_size / 2.0,
-                image: player_image.clone(),
+                image: &player_image,
                 radius: 0.75,
             },
             speed: 10.0,
         };
 
         let mut items: Vec<_> = {
-            let item_radius = 0.5;
-            (0..num_items)
-                .map(|_| Item {
-                    pos: Vec2::from([
-                        rng.sample(Uniform::new(item_radius, map_size.x - item_radius)),
-                        rng.sample(Uniform::new(item_radius, map_size.y - item_radius)),
-                    ]),
-                    image: items_images_and_probs[rng.sample(
-                        WeightedIndex::new(items_images_and_probs.iter().map(|(_, prob)| prob))
-                            .unwrap(),
-                    )]
-                    .0
-                    .clone(),
+            let mut samples: Vec<_> = (0..num_items)
+                .map(|_| {
+                    let pos = Vec2::from([rng.sample(&x_distr), rng.sample(&y_distr)]);
+                    (rng.sample(&image_distr), pos)
+                })
+                .collect();
+            // Group items by texture so that consecutive draw calls are batched together
+            samples.sort_by_key(|&(index, _)| index);
+            samples
+                .into_iter()
+                .map(|(index, pos)| Item {
+                    pos,
+                    image: &items_images_and_probs[index].0,
                     radius: item_radius,
                 })
                 .collect()
@@ -104,6 +110,11 @@ pub async fn main() -> Result<(), Error> {
 
         let mut timeout = Duration::from_secs_f32(1.0);
 
+        // Counter texts are rebuilt only when number of remaining items changes
+        let mut shown_len = None;
+        let mut collected_text = String::new();
+        let mut remaining_text = String::new();
+
         loop {
             if is_key_down(KeyCode::Escape) {
                 return Ok(());
@@ -113,32 +124,16 @@ pub async fn main() -> Result<(), Error> {
 
             // Move player
             {
-                let mut motion = Vec2::ZERO;
-                if is_key_down(KeyCode::Up) || is_key_down(KeyCode::W) {
-                    motion -= Vec2::from([0.0, 1.0]);
-                }
-                if is_key_down(KeyCode::Down) || is_key_down(KeyCode::S) {
-                    motion += Vec2::from([0.0, 1.0]);
-                }
-                if is_key_down(KeyCode::Left) || is_key_down(KeyCode::A) {
-                    motion -= Vec2::from([1.0, 0.0]);
-                }
-                if is_key_down(KeyCode::Right) || is_key_down(KeyCode::D) {
-                    motion += Vec2::from([1.0, 0.0]);
-                }
                 let step = player.speed * dt.as_secs_f32();
-                player.pos += motion * step;
-
-                player.pos = player.pos.clamp(
-                    Vec2::from([player.radius; 2]),
-                    map_size - Vec2::from([player.radius; 2]),
-                );
+                let margin = Vec2::splat(player.radius);
+                player.pos = (player.pos + motion_keys() * step).clamp(margin, map_size - margin);
             }
 
             // Collect items and exit if no items remain
             {
                 items.retain(|item| {
-                    if (player.pos - item.pos).length() > (player.radius + item.radius) {
+                    if player.pos.distance_squared(item.pos) > (player.radius + item.radius).powi(2)
+                    {
                         true
                     } else {
                         player.radius += 1.0 / (mean_items * (2.0 * player.radius).sqrt());
@@ -172,14 +167,21 @@ pub async fn main() -> Result<(), Error> {
 
                     draw_rectangle(0.0, 0.0, map_size.x, map_size.y, color::DARKGRAY);
 
+                    let items_offset = Vec2::new(0.0, 0.1 * (PI * get_time() as f32).sin());
                     for item in &items {
-                        item.draw(Vec2::new(0.0, 0.1 * (PI * get_time() as f32).sin()));
+                        item.draw(items_offset);
                     }
                     player.draw(Vec2::ZERO);
 
                     set_default_camera();
                 }
 
+                if shown_len != Some(items.len()) {
+                    collected_text = format!("{}", num_items - items.len());
+                    remaining_text = format!("{}", items.len());
+                    shown_len = Some(items.len());
+                }
+
                 let text_offset = 6.0;
                 draw_text_aligned(
                     "Собрано",
@@ -191,7 +193,7 @@ pub async fn main() -> Result<(), Error> {
                     color::WHITE,
                 );
                 draw_text_aligned(
-                    &format!("{}", num_items - items.len()),
+                    &collected_text,
                     text_offset,
                     scale * 2.6,
                     TextAlign::Left,
@@ -210,7 +212,7 @@ pub async fn main() -> Result<(), Error> {
                     color::WHITE,
                 );
                 draw_text_aligned(
-                    &format!("{}", items.len()),
+                    &remaining_text,
                     viewport.x - text_offset,
                     scale * 2.6,
                     TextAlign::Right,
@@ -228,6 +230,7 @@ pub async fn main() -> Result<(), Error> {
 pub struct Game {
     mouse: Texture2D,
     cheese: Texture2D,
+    apple: Texture2D,
 }
 
 impl Game {
@@ -236,6 +239,7 @@ impl Game {
         Ok(Self {
             mouse: load_texture("mouse.png").await?,
             cheese: load_texture("cheese.png").await?,
+            apple: load_texture("apple.png").await?,
         })
     }
 }
@@ -269,6 +273,9 @@ impl crate::Game for Game {
     }
 
     fn launch(&self) -> Pin<Box<dyn Future<Output = Result<(), Error>>>> {
-        Box::pin(main())
+        Box::pin(main(
+            self.mouse.clone(),
+            vec![(self.cheese.clone(), 0.8), (self.apple.clone(), 0.2)],
+        ))
     }
 }
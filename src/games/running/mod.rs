@@ -1,6 +1,6 @@
 mod objects;
 
-use crate::compat::mouse_wheel_clamped;
+use crate::compat::{motion_keys, mouse_wheel_clamped};
 
 use self::objects::{Character, Object, Personality};
 use anyhow::Error;
@@ -23,11 +23,7 @@ use std::{future::Future, pin::Pin, time::Duration};
 
 const TILT: f32 = 0.6667;
 
-pub async fn main() -> Result<(), Error> {
-    set_default_filter_mode(FilterMode::Nearest);
-    let tree = TreeSpecies::load("tree.png", "tree.json").await?;
-    let man = Personality::new("man.png", "man.json").await?;
-
+pub async fn main(tree: TreeSpecies, man: Personality) -> Result<(), Error> {
     let mut rng = SmallRng::seed_from_u64(0xdeadbeef);
     let mut static_objects = (0..rng.sample(Poisson::new(64_f32).unwrap()).round() as usize)
         .map(|_| {
@@ -51,19 +47,7 @@ pub async fn main() -> Result<(), Error> {
 
         // Move
         {
-            let mut motion = Vec2::ZERO;
-            if is_key_down(KeyCode::Up) || is_key_down(KeyCode::W) {
-                motion += Vec2::from([0.0, -1.0]);
-            }
-            if is_key_down(KeyCode::Down) || is_key_down(KeyCode::S) {
-                motion += Vec2::from([0.0, 1.0]);
-            }
-            if is_key_down(KeyCode::Left) || is_key_down(KeyCode::A) {
-                motion += Vec2::from([-1.0, 0.0]);
-            }
-            if is_key_down(KeyCode::Right) || is_key_down(KeyCode::D) {
-                motion += Vec2::from([1.0, 0.0]);
-            }
+            let motion = motion_keys();
             zoom *= (0.2 * mouse_wheel_clamped().1).exp();
 
             player.step(motion, dt);
@@ -98,6 +82,7 @@ pub async fn main() -> Result<(), Error> {
 }
 
 pub struct Game {
+    tree: TreeSpecies,
     man: Personality,
 }
 
@@ -105,6 +90,7 @@ impl Game {
     pub async fn new() -> Result<Self, Error> {
         set_default_filter_mode(FilterMode::Nearest);
         Ok(Self {
+            tree: TreeSpecies::load("tree.png", "tree.json").await?,
             man: Personality::new("man.png", "man.json").await?,
         })
     }
@@ -131,6 +117,6 @@ impl crate::Game for Game {
     }
 
     fn launch(&self) -> Pin<Box<dyn Future<Output = Result<(), Error>>>> {
-        Box::pin(main())
+        Box::pin(main(self.tree.clone(), self.man.clone()))
     }
 }
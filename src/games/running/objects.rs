@@ -37,9 +37,13 @@ pub struct TreeSpecies {
 
 impl TreeSpecies {
     pub async fn load(texture_path: &str, animation_path: &str) -> Result<Self, Error> {
+        let animation: TreeAnimation = serde_json::from_slice(&load_file(animation_path).await?)?;
+        if animation.trunk.is_empty() || animation.leaves.is_empty() {
+            return Err(anyhow!("Empty animation in {animation_path}"));
+        }
         Ok(Self {
             texture: load_texture(texture_path).await?,
-            animation: serde_json::from_slice(&load_file(animation_path).await?)?,
+            animation,
         })
     }
 }
@@ -111,7 +115,11 @@ impl PersonAnimations {
                 .into_iter()
                 .map(|orientation| {
                     let key = name.replace("{}", orientation);
-                    container.remove(&key).ok_or(anyhow!("No such key: {key}"))
+                    match container.remove(&key) {
+                        Some(info) if info.is_empty() => Err(anyhow!("Empty animation: {key}")),
+                        Some(info) => Ok(info),
+                        None => Err(anyhow!("No such key: {key}")),
+                    }
                 })
                 .collect::<Result<Vec<_>, _>>()?
                 .try_into()
@@ -38,9 +38,14 @@ async fn main() -> Result<(), Error> {
             ),
         }
     }
+    let mut screen = Vec2::ZERO;
+    let mut boxes = Vec::new();
     loop {
-        let screen = Vec2::from(screen_size());
-        let boxes = layout::grid((screen.x, screen.y), games.len(), 1.0);
+        // Recompute layout only when window is resized
+        if screen != Vec2::from(screen_size()) {
+            screen = Vec2::from(screen_size());
+            boxes = layout::grid((screen.x, screen.y), games.len(), 1.0);
+        }
 
         clear_background(color::BLACK);
         for ((_, game), &rect) in games.iter().zip(boxes.iter().flatten()) {
@@ -21,6 +21,26 @@ pub enum TextAlign {
     Right,
 }
 
+/// Step in pixels between font sizes that glyphs are rasterized at
+const FONT_SIZE_STEP: u16 = 8;
+
+/// Same as [`camera_font_scale`] but rounds font size up to a multiple of [`FONT_SIZE_STEP`].
+///
+/// Glyphs are cached per font size, so this prevents rasterizing new glyphs
+/// on every frame while window is being resized.
+fn quantized_font_scale(size: f32) -> (u16, f32, f32) {
+    let (font_size, font_scale, font_aspect) = camera_font_scale(size);
+    let quantized = font_size
+        .div_ceil(FONT_SIZE_STEP)
+        .max(1)
+        .saturating_mul(FONT_SIZE_STEP);
+    (
+        quantized,
+        font_scale * font_size as f32 / quantized as f32,
+        font_aspect,
+    )
+}
+
 impl Text {
     pub fn new<S: AsRef<str>>(value: S, font: Option<Font>, size: f32) -> Self {
         let value = value.as_ref().to_string();
@@ -28,31 +48,22 @@ impl Text {
     }
 
     pub fn measure(&self) -> TextDimensions {
-        let (font_size, font_scale, font_aspect) = camera_font_scale(self.size);
+        let (font_size, font_scale, font_aspect) = quantized_font_scale(self.size);
         let mut dims = measure_text(&self.value, self.font.as_ref(), font_size, font_scale);
         dims.width *= font_aspect;
         dims
     }
 
     pub fn draw_aligned(&self, x: f32, y: f32, align: TextAlign, color: Color) {
-        let (font_size, font_scale, font_scale_aspect) = camera_font_scale(self.size);
-        let TextDimensions { mut width, .. } =
-            measure_text(&self.value, self.font.as_ref(), font_size, font_scale);
-        width *= font_scale_aspect;
-        let x = x - match align {
-            TextAlign::Left => 0.0,
-            TextAlign::Center => width / 2.0,
-            TextAlign::Right => width,
-        };
-        let params = TextParams {
-            font: self.font.as_ref(),
-            font_size,
-            font_scale,
-            font_scale_aspect,
+        draw_text_aligned(
+            &self.value,
+            x,
+            y,
+            align,
+            self.font.as_ref(),
+            self.size,
             color,
-            ..Default::default()
-        };
-        draw_text_ex(&self.value, x, y, params);
+        )
     }
 }
 
@@ -65,8 +76,23 @@ pub fn draw_text_aligned(
     size: f32,
     color: Color,
 ) {
-    // TODO: Remove unnecessary text and font copying
-    Text::new(text, font.cloned(), size).draw_aligned(x, y, align, color)
+    let (font_size, font_scale, font_scale_aspect) = quantized_font_scale(size);
+    let TextDimensions { mut width, .. } = measure_text(text, font, font_size, font_scale);
+    width *= font_scale_aspect;
+    let x = x - match align {
+        TextAlign::Left => 0.0,
+        TextAlign::Center => width / 2.0,
+        TextAlign::Right => width,
+    };
+    let params = TextParams {
+        font,
+        font_size,
+        font_scale,
+        font_scale_aspect,
+        color,
+        ..Default::default()
+    };
+    draw_text_ex(text, x, y, params);
 }
 
 pub async fn load_default_font() -> Result<Font> {